@@ -6,18 +6,75 @@ Truthy — Hallucination Detector API  v7.0
 - Correct answer derived from web context when hallucination detected
 - Language: passed via X-Language header; LLM responds in that language
 """
-from fastapi import FastAPI, HTTPException, Header
+from fastapi import FastAPI, HTTPException, Header, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from typing import Optional
-import pathlib, urllib.request, urllib.parse, json, re, os
-
-from src.detector import HallucinationDetector
+import pathlib, urllib.parse, asyncio, threading, hashlib, time, os
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+import anyio
+import httpx
+import orjson
+
+# Load .env before anything reads the environment (dotenv is optional)
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+from src.detector import HallucinationDetector, groq_configured
 from src.models   import DetectionInput
 
-app = FastAPI(title="Truthy — Hallucination Detector API", version="7.0.0")
+__version__ = "7.0.0"
+_USER_AGENT = "TruthyDetector/" + ".".join(__version__.split(".")[:2])   # major.minor
+
+# Keys are read once at import — restart the server after changing them.
+# GROQ_API_KEY is read by src.detector, which is what actually uses it.
+_BRAVE_KEY = os.environ.get("BRAVE_API_KEY", "").strip()
+
+# Shared connection pool — keep-alive sockets to Brave / DuckDuckGo / Wikipedia
+# are reused across requests instead of paying a TCP+TLS handshake every call.
+# HTTP/2 lets concurrent provider calls to one host share a single connection;
+# httpx negotiates and decodes gzip itself, and br once the brotli extra is in.
+def _http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=True,
+        headers={"User-Agent": _USER_AGENT},
+        limits=httpx.Limits(max_connections=128, max_keepalive_connections=16, keepalive_expiry=30),
+    )
+
+
+_HTTP = _http_client()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson (FastAPI's own class is deprecated)."""
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Shutdown closes the pool, so a second startup in the same process
+    # (another TestClient, an embedded restart) needs a fresh one.
+    global _HTTP
+    if _HTTP.is_closed:
+        _HTTP = _http_client()
+    yield
+    await _HTTP.aclose()
+
+
+app = FastAPI(
+    title="Truthy — Hallucination Detector API", version=__version__,
+    lifespan=lifespan, default_response_class=ORJSONResponse,
+)
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
 
 static_dir = pathlib.Path("static")
@@ -28,28 +85,36 @@ if static_dir.exists():
 # ═══════════════════════════════════════════════════════════════
 # WEB SEARCH — Multi-source, real-time
 # Priority: Brave Search API → DuckDuckGo → Wikipedia REST → Wikipedia Search
+#   (with a Brave key: Brave + Wikipedia REST first, the rest only if needed)
+# Providers run concurrently (httpx.AsyncClient); results merged by priority
 # Returns structured WebContext object instead of raw string
 # ═══════════════════════════════════════════════════════════════
 
 class WebContext:
     """Structured web context with title, key facts, and summary paragraphs."""
+    __slots__ = ("title", "facts", "summary", "sources", "_urls", "_paragraph")
+
     def __init__(self):
         self.title:   str        = ""
         self.facts:   list[dict] = []   # [{label, value}, ...]
         self.summary: str        = ""
         self.sources: list[dict] = []   # [{title, url, snippet}, ...]
+        self._urls:   set[str]   = set()
+        self._paragraph: Optional[str] = None
 
     def to_paragraph(self) -> str:
-        """Convert to plain paragraph for the LLM detector."""
-        parts = []
-        if self.title:
-            parts.append(f"Topic: {self.title}")
-        if self.summary:
-            parts.append(self.summary)
-        if self.facts:
-            facts_str = "; ".join(f"{f['label']}: {f['value']}" for f in self.facts[:8])
-            parts.append(f"Key facts: {facts_str}")
-        return "\n\n".join(parts).strip()
+        """Convert to plain paragraph for the LLM detector (rendered once)."""
+        if self._paragraph is None:
+            parts = []
+            if self.title:
+                parts.append(f"Topic: {self.title}")
+            if self.summary:
+                parts.append(self.summary)
+            if self.facts:
+                facts_str = "; ".join(f"{f['label']}: {f['value']}" for f in self.facts[:8])
+                parts.append(f"Key facts: {facts_str}")
+            self._paragraph = "\n\n".join(parts).strip()
+        return self._paragraph
 
     def to_dict(self) -> dict:
         return {
@@ -59,26 +124,146 @@ class WebContext:
             "sources": self.sources,
         }
 
-
+    def score(self) -> int:
+        """Rough richness measure: summary length plus 100 per source."""
+        return len(self.summary) + 100 * len(self.sources)
+
+    def merge(self, other: "WebContext"):
+        """Fold a lower-priority provider's result into this context."""
+        self._paragraph = None
+        if not self.title:
+            self.title = other.title
+        if not self.summary:
+            self.summary = other.summary
+        self.facts.extend(other.facts)
+        for s in other.sources:
+            self.add_source(s["title"], s["url"], s["snippet"])
+
+    def add_source(self, title: str, url: str, snippet: str):
+        """Append a source unless its URL is already listed."""
+        if url in self._urls:
+            return
+        self._urls.add(url)
+        self.sources.append({"title": title, "url": url, "snippet": snippet})
+
+
+class QueryCache:
+    """In-process LRU cache with per-entry TTL for web search results."""
+    def __init__(self, max_size: int = 2048, ttl: float = 600):
+        self.max_size = max_size
+        self.ttl      = ttl
+        self._data: OrderedDict[str, tuple[float, WebContext]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits   = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(query: str) -> str:
+        return hashlib.md5(query.lower().encode(), usedforsecurity=False).hexdigest()
+
+    def get(self, key: str) -> Optional[WebContext]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._data[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, ctx: WebContext):
+        with self._lock:
+            self._data[key] = (time.monotonic(), ctx)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+_SEARCH_CACHE = QueryCache(max_size=2048, ttl=600)
+
+# Context at or above this score is enough for the detector; lower
+# provider tiers are skipped once it is reached.
+_TARGET_SCORE = 400
+
+# Wall-clock budget for a whole search, across all provider stages.
+_SEARCH_BUDGET = 8.0
+
+
+# Leading question words dropped before searching; "tell me about" is the
+# one multi-word prefix and is checked on its own.
+_LEADING_WORDS = frozenset(
+    "what who when where why how which is are was were did do does".split()
+)
+_TELL_ME_ABOUT = "tell me about"
+
+
+def _strip_tags(s: str) -> str:
+    """Drop <...> tags (Wikipedia's searchmatch spans) with a single forward scan."""
+    if "<" not in s:
+        return s
+    out, i, j = [], 0, 0
+    while True:
+        j = s.find("<", j)
+        k = s.find(">", j) if j >= 0 else -1
+        if k < 0:
+            break
+        if k == j + 1:      # an empty <> is text, as with <[^>]+>
+            j = k
+            continue
+        out.append(s[i:j])
+        i = j = k + 1
+    out.append(s[i:])
+    return "".join(out)
+
+
+@lru_cache(maxsize=4096)
 def _clean_query(question: str) -> str:
     q = question.strip()
-    q = re.sub(
-        r'^(what|who|when|where|why|how|which|is|are|was|were|did|do|does|tell me about)\s+',
-        '', q, flags=re.IGNORECASE
-    )
+    n = len(_TELL_ME_ABOUT)
+    if q[:n].lower() == _TELL_ME_ABOUT and q[n:n + 1].isspace():
+        q = q[n:].lstrip()
+    else:
+        parts = q.split(maxsplit=1)
+        if len(parts) == 2 and parts[0].lower() in _LEADING_WORDS:
+            q = parts[1]
     return q[:200] if len(q) > 10 else question[:200]
 
 
-def _brave_search(query: str, api_key: str, ctx: WebContext):
+# Upper bound on a provider response body. Snippets are clamped to 200
+# chars anyway, so anything larger is an error page or worse. Brave's
+# count=5 web results run to ~100 KB; Wikipedia payloads stay under a few KB.
+_MAX_BODY = 256 * 1024
+
+
+async def _get_json(client: httpx.AsyncClient, url: str, timeout: float,
+                    headers: Optional[dict] = None, max_bytes: int = _MAX_BODY):
+    """GET url and parse its JSON body, refusing bodies over max_bytes."""
+    async with client.stream("GET", url, headers=headers,
+                             timeout=httpx.Timeout(timeout, connect=2.0)) as r:
+        r.raise_for_status()
+        body = bytearray()
+        async for chunk in r.aiter_bytes():
+            body += chunk
+            if len(body) > max_bytes:
+                raise ValueError("response too large")
+    return orjson.loads(body)
+
+
+async def _brave_search(client: httpx.AsyncClient, query: str, api_key: str) -> WebContext:
+    ctx = WebContext()
     url = ("https://api.search.brave.com/res/v1/web/search?"
            + urllib.parse.urlencode({"q": query, "count": 5, "text_decorations": 0, "search_lang": "en"}))
-    req = urllib.request.Request(url, headers={
+    data = await _get_json(client, url, timeout=8, headers={
         "Accept": "application/json",
         "X-Subscription-Token": api_key,
-        "User-Agent": "TruthyDetector/7.0",
     })
-    with urllib.request.urlopen(req, timeout=8) as r:
-        data = json.loads(r.read())
 
     results = data.get("web", {}).get("results", [])
     summaries = []
@@ -88,32 +273,32 @@ def _brave_search(query: str, api_key: str, ctx: WebContext):
         url_val = item.get("url", "")
         if snippet:
             summaries.append(f"{title}: {snippet}")
-            ctx.sources.append({"title": title, "url": url_val, "snippet": snippet[:200]})
+            ctx.add_source(title, url_val, snippet[:200])
 
     if summaries:
         ctx.summary = " ".join(summaries[:3])
-        if not ctx.title and results:
+        if results:
             ctx.title = results[0].get("title", "")
+    return ctx
 
 
-def _duckduckgo_search(query: str, ctx: WebContext):
+async def _duckduckgo_search(client: httpx.AsyncClient, query: str) -> WebContext:
+    ctx = WebContext()
     url = ("https://api.duckduckgo.com/?"
            + urllib.parse.urlencode({"q": query, "format": "json",
                                      "no_redirect": 1, "no_html": 1, "skip_disambig": 1}))
-    req = urllib.request.Request(url, headers={"User-Agent": "TruthyDetector/7.0"})
-    with urllib.request.urlopen(req, timeout=6) as r:
-        ddg = json.loads(r.read())
+    ddg = await _get_json(client, url, timeout=6, max_bytes=128 * 1024)
 
     if ddg.get("Heading"):
         ctx.title = ddg["Heading"]
 
     if ddg.get("AbstractText"):
         ctx.summary = ddg["AbstractText"]
-        ctx.sources.append({
-            "title":   ddg.get("Heading", "Wikipedia"),
-            "url":     ddg.get("AbstractURL", "https://en.wikipedia.org"),
-            "snippet": ddg["AbstractText"][:200],
-        })
+        ctx.add_source(
+            ddg.get("Heading", "Wikipedia"),
+            ddg.get("AbstractURL", "https://en.wikipedia.org"),
+            ddg["AbstractText"][:200],
+        )
 
     if ddg.get("Answer"):
         ctx.facts.insert(0, {"label": "Direct Answer", "value": ddg["Answer"]})
@@ -125,93 +310,145 @@ def _duckduckgo_search(query: str, ctx: WebContext):
 
     for rt in (ddg.get("RelatedTopics") or [])[:3]:
         if isinstance(rt, dict) and rt.get("Text") and rt.get("FirstURL"):
-            ctx.sources.append({
-                "title":   rt["Text"][:60],
-                "url":     rt["FirstURL"],
-                "snippet": rt["Text"][:200],
-            })
+            ctx.add_source(rt["Text"][:60], rt["FirstURL"], rt["Text"][:200])
+    return ctx
 
 
-def _wikipedia_rest(query: str, ctx: WebContext):
-    url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{urllib.parse.quote(query[:100])}"
-    req = urllib.request.Request(url, headers={"User-Agent": "TruthyDetector/7.0"})
-    with urllib.request.urlopen(req, timeout=7) as r:
-        wiki = json.loads(r.read())
+async def _wikipedia_rest(client: httpx.AsyncClient, quoted: str) -> WebContext:
+    ctx = WebContext()
+    url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{quoted}"
+    wiki = await _get_json(client, url, timeout=7, max_bytes=64 * 1024)
 
     if not wiki.get("extract"):
-        return
-
-    if not ctx.title:
-        ctx.title = wiki.get("title", "")
-    if not ctx.summary:
-        ctx.summary = wiki["extract"][:800]
-
-    page_url = wiki.get("content_urls", {}).get("desktop", {}).get("page", "https://en.wikipedia.org")
-    if not any(s["url"] == page_url for s in ctx.sources):
-        ctx.sources.append({
-            "title":   wiki.get("title", "Wikipedia"),
-            "url":     page_url,
-            "snippet": wiki["extract"][:200],
-        })
+        return ctx
+
+    ctx.title   = wiki.get("title", "")
+    ctx.summary = wiki["extract"][:800]
+    ctx.add_source(
+        wiki.get("title", "Wikipedia"),
+        wiki.get("content_urls", {}).get("desktop", {}).get("page", "https://en.wikipedia.org"),
+        wiki["extract"][:200],
+    )
+    return ctx
 
 
-def _wikipedia_search(query: str, ctx: WebContext):
+async def _wikipedia_search(client: httpx.AsyncClient, query: str) -> WebContext:
+    ctx = WebContext()
     url = ("https://en.wikipedia.org/w/api.php?"
            + urllib.parse.urlencode({
                "action": "query", "list": "search",
                "srsearch": query[:100], "format": "json", "srlimit": 3,
            }))
-    req = urllib.request.Request(url, headers={"User-Agent": "TruthyDetector/7.0"})
-    with urllib.request.urlopen(req, timeout=6) as r:
-        data = json.loads(r.read())
+    data = await _get_json(client, url, timeout=6, max_bytes=64 * 1024)
 
     for item in data.get("query", {}).get("search", [])[:2]:
-        snippet = re.sub(r'<[^>]+>', '', item.get("snippet", ""))
+        snippet = _strip_tags(item.get("snippet", ""))
         title   = item.get("title", "")
         if snippet:
             if not ctx.summary:
                 ctx.summary = f"{title}: {snippet}"
-            ctx.sources.append({
-                "title": title,
-                "url":   f"https://en.wikipedia.org/wiki/{urllib.parse.quote(title.replace(' ', '_'))}",
-                "snippet": snippet[:200],
-            })
+            ctx.add_source(
+                title,
+                f"https://en.wikipedia.org/wiki/{urllib.parse.quote(title.replace(' ', '_'))}",
+                snippet[:200],
+            )
+    return ctx
 
 
-def web_search_context(question: str) -> WebContext:
+async def _gather_into(ctx: WebContext, providers: list, failed: list,
+                       skip_ahead: bool = True) -> bool:
+    """
+    Race providers concurrently and merge their results into ctx in list
+    (priority) order. Returns True as soon as ctx reaches _TARGET_SCORE and
+    cancels whatever is still in flight. With skip_ahead, a lower-priority
+    provider that answered first may settle it alone; pass False when the
+    first provider is paid (Brave) and must not be thrown away. Provider
+    errors are appended to failed.
+    """
+    tasks   = [asyncio.create_task(p) for p in providers]
+    results = {}
+    merged  = 0          # tasks[:merged] are already folded into ctx
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                if t.exception() is None:
+                    results[t] = t.result()
+                else:
+                    failed.append(t.exception())
+
+            while merged < len(tasks) and tasks[merged].done():
+                if tasks[merged] in results:
+                    ctx.merge(results[tasks[merged]])
+                merged += 1
+            if ctx.score() >= _TARGET_SCORE:
+                return True
+
+            # Later providers that already answered may be enough on their own
+            ahead = [results[t] for t in tasks[merged:] if t in results] if skip_ahead else []
+            if ahead:
+                trial = WebContext()
+                trial.merge(ctx)
+                for part in ahead:
+                    trial.merge(part)
+                if trial.score() >= _TARGET_SCORE:
+                    for part in ahead:
+                        ctx.merge(part)
+                    return True
+        return False
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _search_tiers(ctx: WebContext, query: str, brave_key: str, failed: list):
+    quoted = urllib.parse.quote(query[:100])
+    if brave_key:
+        # Speculatively pair Brave with Wikipedia REST; the other free
+        # providers are only queried if the pair comes up short. Brave's
+        # quota is already spent once it is sent, so always wait for it.
+        if not await _gather_into(ctx, [_brave_search(_HTTP, query, brave_key),
+                                        _wikipedia_rest(_HTTP, quoted)], failed,
+                                  skip_ahead=False):
+            await _gather_into(ctx, [_duckduckgo_search(_HTTP, query),
+                                     _wikipedia_search(_HTTP, query)], failed)
+    else:
+        await _gather_into(ctx, [_duckduckgo_search(_HTTP, query),
+                                 _wikipedia_rest(_HTTP, quoted),
+                                 _wikipedia_search(_HTTP, query)], failed)
+
+
+async def web_search_context(question: str) -> WebContext:
     """
     Fetch real-time web context from multiple sources.
+    Results are cached for 10 minutes per normalised query.
+    Providers are queried concurrently and merged in priority order until
+    the context reaches _TARGET_SCORE.
     Returns structured WebContext with title, facts, summary, and sources.
     """
     query = _clean_query(question)
+    key   = QueryCache.key(query)
+    cached = _SEARCH_CACHE.get(key)
+    if cached is not None:
+        return cached
     ctx   = WebContext()
 
-    brave_key = os.environ.get("BRAVE_API_KEY", "").strip()
-    if brave_key:
-        try:
-            _brave_search(query, brave_key, ctx)
-        except Exception:
-            pass
-
-    if not ctx.summary:
-        try:
-            _duckduckgo_search(query, ctx)
-        except Exception:
-            pass
-
-    if len(ctx.summary) < 150:
-        try:
-            _wikipedia_rest(query, ctx)
-        except Exception:
-            pass
-
-    if not ctx.summary:
-        try:
-            _wikipedia_search(query, ctx)
-        except Exception:
-            pass
+    # One overall deadline: whatever was merged before it expires is kept
+    failed, timed_out = [], False
+    try:
+        await asyncio.wait_for(_search_tiers(ctx, query, _BRAVE_KEY, failed),
+                               timeout=_SEARCH_BUDGET)
+    except asyncio.TimeoutError:
+        timed_out = True
 
     ctx.sources = ctx.sources[:4]
+    # A partial context (deadline hit, or a provider errored and the rest
+    # fell short) is returned but not cached, so the next call retries.
+    complete = not timed_out and (not failed or ctx.score() >= _TARGET_SCORE)
+    if complete and (ctx.summary or ctx.facts):
+        _SEARCH_CACHE.set(key, ctx)
     return ctx
 
 
@@ -220,19 +457,23 @@ def web_search_context(question: str) -> WebContext:
 # ═══════════════════════════════════════════════════════════════
 
 class DetectRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
     paragraph: str = Field(default="")
     question:  str = Field(...)
     answer:    str = Field(...)
     language:  str = Field(default="English")
 
 class SourceInfo(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     title:   str
     url:     str
     snippet: str
 
 class WebContextInfo(BaseModel):
     title:   str = ""
-    facts:   list[dict] = []
+    facts:   list[dict] = Field(default_factory=list)
     summary: str = ""
 
 class DetectResponse(BaseModel):
@@ -247,42 +488,146 @@ class DetectResponse(BaseModel):
     language:              str          = "English"
     web_search_used:       bool         = False
     web_context_raw:       str          = ""
-    web_context_structured: WebContextInfo = WebContextInfo()
-    sources:               list[SourceInfo] = []
+    web_context_structured: WebContextInfo = Field(default_factory=WebContextInfo)
+    sources:               list[SourceInfo] = Field(default_factory=list)
 
 
 # ═══════════════════════════════════════════════════════════════
 # ROUTES
 # ═══════════════════════════════════════════════════════════════
 
+def _load_page(path: str) -> Optional[tuple[bytes, dict]]:
+    """Read a static page once at startup, with its ETag / caching headers."""
+    p = pathlib.Path(path)
+    if not p.exists():
+        return None
+    body = p.read_bytes()
+    etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+    return body, {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+
+_INDEX_PAGE   = _load_page("templates/index.html")
+_SITEMAP_PAGE = _load_page("static/sitemap.xml")
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak If-None-Match comparison, as Starlette's StaticFiles.is_not_modified does."""
+    # Proxies/CDNs that re-compress the body send the tag back as W/"..."
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+
+
+def _serve_page(page: tuple[bytes, dict], request: Request, media_type: str) -> Response:
+    body, headers = page
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=media_type, headers=headers)
+
 @app.get("/", response_class=HTMLResponse, include_in_schema=False)
-async def serve_ui():
-    p = pathlib.Path("templates/index.html")
-    return HTMLResponse(p.read_text(encoding="utf-8")) if p.exists() else HTMLResponse("<h1>Not found</h1>", 404)
+async def serve_ui(request: Request):
+    if _INDEX_PAGE is None:
+        return HTMLResponse("<h1>Not found</h1>", 404)
+    return _serve_page(_INDEX_PAGE, request, "text/html; charset=utf-8")
 
 @app.get("/sitemap.xml", include_in_schema=False)
-def sitemap():
-    p = pathlib.Path("static/sitemap.xml")
-    return FileResponse(str(p), media_type="application/xml") if p.exists() else HTMLResponse("Not found", 404)
+async def sitemap(request: Request):
+    if _SITEMAP_PAGE is None:
+        return HTMLResponse("Not found", 404)
+    return _serve_page(_SITEMAP_PAGE, request, "application/xml")
+
+# Static part of the health payload, built once at startup.
+_HEALTH = {
+    "status": "ok", "version": __version__,
+    "providers": ["free", "openai", "gemini"],
+    "free_mode": "groq_llama3.1_8b",
+    "web_search": "brave+duckduckgo+wikipedia",
+    "brave_configured": bool(_BRAVE_KEY),
+    "groq_configured":  groq_configured(),
+}
 
 @app.get("/health", tags=["System"])
-def health():
-    return {
-        "status": "ok", "version": "7.0.0",
-        "providers": ["free", "openai", "gemini"],
-        "free_mode": "groq_llama3.1_8b",
-        "web_search": "brave+duckduckgo+wikipedia",
-        "brave_configured": bool(os.environ.get("BRAVE_API_KEY")),
-        "groq_configured":  bool(os.environ.get("GROQ_API_KEY")),
-    }
-
-@app.post("/detect", response_model=DetectResponse, tags=["Detection"])
-def detect(
-    req:        DetectRequest,
+async def health():
+    return ORJSONResponse({**_HEALTH, "search_cache": _SEARCH_CACHE.stats()})
+
+# Detector instances keyed by (provider, blake2b(api_key), language) so raw
+# tenant keys are never used as cache keys. Bounded LRU.
+_DETECTORS: OrderedDict[tuple, HallucinationDetector] = OrderedDict()
+_DETECTORS_LOCK = threading.Lock()
+_DETECTORS_MAX  = 64
+
+
+def _key_digest(api_key: str) -> str:
+    return hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+
+
+def _get_detector(provider: str, api_key: str, language: str) -> HallucinationDetector:
+    """
+    Reuse detector instances across requests so SDK clients and their
+    connection pools are built once per (provider, key, language).
+    Gemini is built per request: genai.configure() is process-global, so a
+    shared instance would call out with whichever key was configured last.
+    """
+    if provider == "gemini":
+        return HallucinationDetector(provider=provider, api_key=api_key, language=language)
+
+    key = (provider, _key_digest(api_key), language)
+    with _DETECTORS_LOCK:
+        detector = _DETECTORS.get(key)
+        if detector is not None:
+            _DETECTORS.move_to_end(key)
+            return detector
+
+    detector = HallucinationDetector(provider=provider, api_key=api_key, language=language)
+    with _DETECTORS_LOCK:
+        _DETECTORS[key] = detector
+        while len(_DETECTORS) > _DETECTORS_MAX:
+            _DETECTORS.popitem(last=False)
+    return detector
+
+# In-flight detections keyed by their full input. Identical concurrent
+# requests await the same upstream LLM call instead of each issuing one.
+_INFLIGHT: dict[tuple, asyncio.Future] = {}
+
+# Blocking LLM calls get their own thread budget so a burst of slow
+# detections cannot exhaust the default pool that static files share.
+_LLM_LIMITER = anyio.CapacityLimiter(32)
+
+
+async def _coalesced_detect(provider: str, api_key: str, language: str,
+                            key: tuple, inp: DetectionInput):
+    task = _INFLIGHT.get(key)
+    if task is None:
+        # Detector construction (SDK imports, client setup) and the LLM call
+        # are both blocking — run them together off the event loop
+        def run():
+            return _get_detector(provider, api_key, language).detect(inp)
+        task = asyncio.ensure_future(anyio.to_thread.run_sync(run, limiter=_LLM_LIMITER))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    # shield: a disconnecting client must not cancel the call for the others
+    return await asyncio.shield(task)
+
+@app.post(
+    "/detect", response_model=DetectResponse, tags=["Detection"],
+    # body is parsed by hand below; describe it for the docs
+    openapi_extra={"requestBody": {"required": True, "content": {
+        "application/json": {"schema": DetectRequest.model_json_schema()}}}},
+)
+async def detect(
+    request:    Request,
     x_api_key:  Optional[str] = Header(default="",     alias="X-API-Key"),
     x_provider: Optional[str] = Header(default="free", alias="X-Provider"),
     x_language: Optional[str] = Header(default="English", alias="X-Language"),
 ):
+    # Parse + validate the body in one pydantic-core pass
+    try:
+        req = DetectRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        )
+
     provider = (x_provider or "free").strip().lower()
     language = (x_language or req.language or "English").strip()
 
@@ -291,41 +636,33 @@ def detect(
     if provider in ("openai", "gemini") and not (x_api_key or "").strip():
         raise HTTPException(401, f"X-API-Key required for provider '{provider}'.")
 
-    paragraph       = req.paragraph.strip()
+    paragraph       = req.paragraph
     web_search_used = False
     web_ctx_raw     = ""
-    web_ctx_struct  = WebContextInfo()
+    web_ctx_struct  = {"title": "", "facts": [], "summary": ""}
     sources         = []
 
     # Auto web search when no context provided
     if not paragraph:
         try:
-            wctx = web_search_context(req.question)
+            wctx = await web_search_context(req.question)
             para_from_web = wctx.to_paragraph()
             if para_from_web:
                 paragraph       = para_from_web
                 web_search_used = True
                 web_ctx_raw     = para_from_web
-                web_ctx_struct  = WebContextInfo(
-                    title   = wctx.title,
-                    facts   = wctx.facts,
-                    summary = wctx.summary,
-                )
+                web_ctx_struct  = {"title": wctx.title, "facts": wctx.facts, "summary": wctx.summary}
                 sources = wctx.sources
         except Exception:
             pass
 
     try:
-        detector = HallucinationDetector(
-            provider=provider,
-            api_key=(x_api_key or "").strip(),
-            language=language,
+        api_key  = (x_api_key or "").strip()
+        result   = await _coalesced_detect(
+            provider, api_key, language,
+            (provider, _key_digest(api_key), language, paragraph, req.question, req.answer),
+            DetectionInput(paragraph=paragraph, question=req.question, answer=req.answer),
         )
-        result = detector.detect(DetectionInput(
-            paragraph=paragraph,
-            question=req.question,
-            answer=req.answer,
-        ))
     except Exception as e:
         msg = str(e)
         if any(k in msg.lower() for k in ["invalid_api_key","authentication","401","api key"]):
@@ -334,18 +671,20 @@ def detect(
             raise HTTPException(429, "Rate limit exceeded. Try again shortly.")
         raise HTTPException(500, msg)
 
-    return DetectResponse(
-        is_hallucinated        = result.is_hallucinated,
-        confidence             = result.confidence,
-        hallucination_types    = result.type_codes,
-        hallucination_names    = [t.display_name for t in result.hallucination_types],
-        hallucinated_elements  = result.hallucinated_elements,
-        explanation            = result.explanation,
-        correct_answer         = result.correct_answer,
-        provider               = provider,
-        language               = language,
-        web_search_used        = web_search_used,
-        web_context_raw        = web_ctx_raw,
-        web_context_structured = web_ctx_struct,
-        sources                = [SourceInfo(**s) for s in sources],
-    )
+    # Output is built from trusted values, so skip DetectResponse validation
+    # and serialize straight to bytes; response_model still drives the docs.
+    return ORJSONResponse({
+        "is_hallucinated":        result.is_hallucinated,
+        "confidence":             result.confidence,
+        "hallucination_types":    result.type_codes,
+        "hallucination_names":    [t.display_name for t in result.hallucination_types],
+        "hallucinated_elements":  result.hallucinated_elements,
+        "explanation":            result.explanation,
+        "correct_answer":         result.correct_answer,
+        "provider":               provider,
+        "language":               language,
+        "web_search_used":        web_search_used,
+        "web_context_raw":        web_ctx_raw,
+        "web_context_structured": web_ctx_struct,
+        "sources":                sources,
+    })
@@ -12,7 +12,11 @@ Usage:
 """
 
 import argparse
+import asyncio
+import json
 import sys
+from collections import deque
+from itertools import chain, islice
 
 # Load .env file automatically (must come before importing detector)
 try:
@@ -21,11 +25,27 @@ try:
 except ImportError:
     pass  # dotenv optional; user can export env vars manually
 
+try:
+    import ijson
+except ImportError:
+    ijson = None  # ijson optional; --input falls back to json.load
+
+_JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson else ())
+
 from src.detector import HallucinationDetector
 from src.display import ResultDisplay
 from src.samples import SAMPLE_TESTS
 from src.models import DetectionInput
 
+_SEP = "═" * 65
+_RULE = "─" * 65
+
+
+def _write_header(title: str, sep: str = _SEP, trailer: str = ""):
+    """Write a separator-framed title in one stdout call."""
+    sys.stdout.write(f"\n{sep}\n  {title}\n{sep}\n{trailer}")
+    sys.stdout.flush()
+
 
 def run_interactive(detector: HallucinationDetector):
     """Interactive mode: user types paragraph, question, answer."""
@@ -33,9 +53,7 @@ def run_interactive(detector: HallucinationDetector):
     display.print_banner()
 
     while True:
-        print("\n" + "─" * 65)
-        print("  📝  NEW DETECTION  (type 'quit' to exit)")
-        print("─" * 65)
+        _write_header("📝  NEW DETECTION  (type 'quit' to exit)", sep=_RULE)
 
         paragraph = _multiline_input(
             "\n[1/3] Context Paragraph\n"
@@ -75,24 +93,29 @@ def run_interactive(detector: HallucinationDetector):
     print("\n  👋  Goodbye!\n")
 
 
-def run_demo(detector: HallucinationDetector):
-    """Run all 5 built-in sample test cases."""
+async def run_demo(detector: HallucinationDetector, concurrency: int = 3):
+    """Run all 5 built-in sample test cases, up to `concurrency` at a time."""
     display = ResultDisplay()
     display.print_banner()
     print(f"\n  Running {len(SAMPLE_TESTS)} sample test cases...\n")
 
-    for i, sample in enumerate(SAMPLE_TESTS, 1):
-        print(f"\n{'═' * 65}")
-        print(f"  SAMPLE TEST #{i}")
-        print(f"{'═' * 65}")
-        detection_input = DetectionInput(**sample)
-        print(f"\n  ⏳  Analyzing test #{i}...\n")
-        result = detector.detect(detection_input)
+    sem = asyncio.Semaphore(concurrency)   # stay friendly to provider rate limits
+
+    async def _one(detection_input: DetectionInput):
+        async with sem:
+            result = await asyncio.to_thread(detector.detect, detection_input)
+        return detection_input, result
+
+    tasks = [asyncio.create_task(_one(sample)) for sample in SAMPLE_TESTS]
+    print(f"  ⏳  Analyzing {len(tasks)} tests ({concurrency} at a time)...\n")
+
+    # Results are shown in sample order as soon as each one is ready
+    for i, task in enumerate(tasks, 1):
+        detection_input, result = await task
+        _write_header(f"SAMPLE TEST #{i}")
         display.show_result(detection_input, result)
 
-    print(f"\n{'═' * 65}")
-    print("  ✅  All sample tests complete.")
-    print(f"{'═' * 65}\n")
+    _write_header("✅  All sample tests complete.", trailer="\n")
 
 
 def run_single_test(detector: HallucinationDetector, test_num: int):
@@ -104,48 +127,86 @@ def run_single_test(detector: HallucinationDetector, test_num: int):
         print(f"\n  ⚠  Invalid test number. Choose 1–{len(SAMPLE_TESTS)}.\n")
         sys.exit(1)
 
-    sample = SAMPLE_TESTS[test_num - 1]
-    print(f"\n{'═' * 65}")
-    print(f"  SAMPLE TEST #{test_num}")
-    print(f"{'═' * 65}")
-    detection_input = DetectionInput(**sample)
+    detection_input = SAMPLE_TESTS[test_num - 1]
+    _write_header(f"SAMPLE TEST #{test_num}")
     print(f"\n  ⏳  Analyzing...\n")
     result = detector.detect(detection_input)
     display.show_result(detection_input, result)
 
 
-def run_from_file(detector: HallucinationDetector, filepath: str):
-    """Load input from a JSON file and run detection."""
-    import json
+async def run_from_file(detector: HallucinationDetector, filepath: str, window: int = 3):
+    """Load input from a JSON file and run detection.
+
+    Top-level arrays are streamed with ijson when it is installed, so detections
+    start before the file is fully parsed and memory stays flat.
+    """
     display = ResultDisplay()
     display.print_banner()
 
     try:
-        with open(filepath) as f:
-            data = json.load(f)
+        f = open(filepath, "rb")
     except FileNotFoundError:
         print(f"\n  ⚠  File not found: {filepath}\n")
         sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"\n  ⚠  Invalid JSON: {e}\n")
-        sys.exit(1)
 
-    # Support single dict or list of dicts
-    entries = [data] if isinstance(data, dict) else data
-    for i, entry in enumerate(entries, 1):
-        if len(entries) > 1:
-            print(f"\n{'═' * 65}")
-            print(f"  ENTRY #{i}")
-            print(f"{'═' * 65}")
-        detection_input = DetectionInput(
-            paragraph=entry.get("paragraph", ""),
-            question=entry["question"],
-            answer=entry["answer"]
-        )
-        print(f"\n  ⏳  Analyzing...\n")
-        result = detector.detect(detection_input)
+    with f:
+        try:
+            is_list = _starts_with_array(f)
+            if is_list and ijson is not None:
+                entries = iter(ijson.items(f, "item"))
+            else:
+                data = json.load(f)
+                # Support single dict or list of dicts
+                entries = iter(data if isinstance(data, list) else [data])
+            # Number entries only when there is more than one; peeking two
+            # ahead keeps that true for streamed arrays too
+            head = list(islice(entries, 2))
+            print(f"\n  ⏳  Analyzing...\n")
+            await _detect_entries(detector, display, chain(head, entries),
+                                  len(head) > 1, window)
+        except _JSON_ERRORS as e:
+            print(f"\n  ⚠  Invalid JSON: {e}\n")
+            sys.exit(1)
+
+
+async def _detect_entries(detector, display, entries, numbered: bool, window: int):
+    """Run up to `window` detections ahead of the display, printing in input order.
+
+    If reading the input fails partway, detections already started are still
+    shown before the error propagates.
+    """
+    pending = deque()
+
+    async def _show_next():
+        i, detection_input, task = pending.popleft()
+        result = await task
+        if numbered:
+            _write_header(f"ENTRY #{i}")
         display.show_result(detection_input, result)
 
+    try:
+        for i, entry in enumerate(entries, 1):
+            detection_input = DetectionInput(
+                paragraph=entry.get("paragraph", ""),
+                question=entry["question"],
+                answer=entry["answer"]
+            )
+            task = asyncio.create_task(asyncio.to_thread(detector.detect, detection_input))
+            pending.append((i, detection_input, task))
+            if len(pending) >= window:
+                await _show_next()
+    finally:
+        while pending:
+            await _show_next()
+
+
+def _starts_with_array(f) -> bool:
+    """Peek at the first non-blank byte of a binary file, then rewind."""
+    while (ch := f.read(1)).isspace():
+        pass
+    f.seek(0)
+    return ch == b"["
+
 
 def _multiline_input(prompt: str) -> str:
     """Read multi-line input until double Enter."""
@@ -173,11 +234,11 @@ def main():
     detector = HallucinationDetector()
 
     if args.demo:
-        run_demo(detector)
+        asyncio.run(run_demo(detector))
     elif args.test:
         run_single_test(detector, args.test)
     elif args.input:
-        run_from_file(detector, args.input)
+        asyncio.run(run_from_file(detector, args.input))
     else:
         run_interactive(detector)
 
@@ -7,8 +7,23 @@ Hallucination detection engine  v7.0
 Taxonomy uses simple 1 / 2 / 3 / 4 numbering.
 """
 
-import json, re, os, urllib.request
-from src.models import DetectionInput, HallucinationResult, HallucinationType
+import asyncio, hashlib, os, string, threading, time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Optional
+import httpx
+import orjson
+from src.models import DetectionInput, HallucinationResult, HallucinationType, LEGACY_CODES
+
+# Read once at import; callers load .env first. Restart to pick up a new key.
+_GROQ_KEY = os.environ.get("GROQ_API_KEY", "").strip()
+
+
+def groq_configured() -> bool:
+    """Whether free mode has a Groq key (False means the heuristic fallback)."""
+    return bool(_GROQ_KEY)
 
 SYSTEM_PROMPT_TEMPLATE = """You are an expert hallucination detection engine for LLM outputs.
 You MUST respond entirely in {language}. All fields — explanation, correct_answer — must be in {language}.
@@ -45,13 +60,20 @@ HARD CONSTRAINT: hallucination_types must contain AT MOST ONE value from: "1", "
 """
 
 
+# Current codes plus legacy aliases, so a "1A" from an older prompt still maps
+_TYPE_MAP = {
+    **{t.value: t for t in HallucinationType},
+    **{c: HallucinationType.from_code(c) for c in LEGACY_CODES},
+}
+
+
+@lru_cache(maxsize=32)
 def _get_system_prompt(language: str = "English") -> str:
     return SYSTEM_PROMPT_TEMPLATE.format(language=language)
 
 
 def _parse_raw(raw: dict) -> HallucinationResult:
-    type_map = {t.value: t for t in HallucinationType}
-    h_types  = [type_map[c] for c in raw.get("hallucination_types", []) if c in type_map]
+    h_types  = [_TYPE_MAP[c] for c in raw.get("hallucination_types", []) if c in _TYPE_MAP]
     if len(h_types) > 1:
         h_types = h_types[:1]
     return HallucinationResult(
@@ -76,17 +98,104 @@ def _build_user_message(inp: DetectionInput) -> str:
 
 
 def _clean_json(text: str) -> dict:
-    text = text.strip()
-    text = re.sub(r"^```json\s*", "", text)
-    text = re.sub(r"^```\s*",     "", text)
-    text = re.sub(r"\s*```$",     "", text)
-    match = re.search(r'\{.*\}', text, re.DOTALL)
-    if match:
-        text = match.group(0)
-    return json.loads(text)
+    """Strip markdown fences and parse the outermost {...} object."""
+    t = text.strip()
+    if t.startswith("```"):
+        t = t.split("\n", 1)[1] if "\n" in t else t[3:]
+    if t.endswith("```"):
+        t = t[:-3]
+    i, j = t.find("{"), t.rfind("}")
+    return orjson.loads(t[i:j + 1] if 0 <= i < j else t)
+
+
+def _fast_parse(text: str) -> dict:
+    """Parse a JSON-mode response directly; only fall back to fence cleanup if that fails."""
+    try:
+        raw = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return _clean_json(text)
+    return raw if isinstance(raw, dict) else _clean_json(text)
+
+
+def parse_response(text: str) -> HallucinationResult:
+    """Turn a model's JSON reply into a HallucinationResult."""
+    return _parse_raw(_fast_parse(text))
+
+
+# ── Heuristic fallback tables (built once) ────────────────────────────────────
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+_STOPWORDS = frozenset({
+    "the","a","an","is","was","are","were","be","been","being","have","has",
+    "had","do","does","did","will","would","shall","should","may","might",
+    "must","can","could","to","of","in","for","on","with","at","by","from",
+    "up","about","into","through","during","it","its","this","that","these",
+    "those","and","but","or","nor","not","so","yet","both","either","neither",
+    "because","as","if","then","than","when","where","who","which","what",
+    "he","she","they","we","you","i","me","him","her","us","them","also",
+})
+
+# (positive framing, negative framing) — one side in the answer and the
+# other in the paragraph signals a predicate inversion
+_INVERSION_PAIRS = (
+    (frozenset({"promotes","supports","endorses","advocates","favors"}),
+     frozenset({"critiques","opposes","criticizes","condemns","depicts","warns"})),
+    (frozenset({"won","victory","champion","defeated","beat"}),
+     frozenset({"lost","surrendered","conceded"})),
+    (frozenset({"invented","created","founded","built"}),
+     frozenset({"discovered","found","explored"})),
+)
+
+# Flattened to (keyword, pair index, polarity) so each text is scanned once
+_INVERSION_WORDS = tuple(
+    (w, cid, pol)
+    for cid, pair in enumerate(_INVERSION_PAIRS)
+    for pol, words in zip((1, -1), pair)
+    for w in words
+)
+
+
+def _tokens(text: str) -> set[str]:
+    return set(text.lower().translate(_PUNCT_TABLE).split()) - _STOPWORDS
+
+
+def _caps(text: str) -> set[str]:
+    """Capitalised words longer than two characters — a cheap named-entity proxy."""
+    return {w for w in text.split() if len(w) > 2 and w[0].isupper()}
+
+
+def _inversion_hits(text: str) -> frozenset[tuple[int, int]]:
+    """(pair index, polarity) for every inversion keyword found as a substring of text."""
+    t = text.lower()
+    return frozenset((cid, pol) for w, cid, pol in _INVERSION_WORDS if w in t)
+
+
+@lru_cache(maxsize=128)
+def _prep_para(paragraph: str) -> tuple[frozenset, frozenset, frozenset]:
+    """Paragraph tokens, capitalised words and inversion hits, cached for paragraphs shared across questions."""
+    return frozenset(_tokens(paragraph)), frozenset(_caps(paragraph)), _inversion_hits(paragraph)
 
 
 # ── FREE MODE — Groq (Llama 3.1 8B Instant) ──────────────────────────────────
+# One keep-alive pool for every synchronous Groq call in the process, so only
+# the first request pays the TCP + TLS handshake. httpx.Client is thread-safe.
+_GROQ_HTTP = httpx.Client(
+    timeout=25,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60),
+)
+
+# Async pool shared by the calls of one adetect_batch (set there, seen by its
+# tasks). An AsyncClient is bound to its event loop, so it can't be global.
+_GROQ_AHTTP: ContextVar[Optional[httpx.AsyncClient]] = ContextVar("_GROQ_AHTTP", default=None)
+
+
+def _groq_async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=25,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    )
+
+
 class FreeDetector:
     """
     Primary  : Groq API — Llama 3.1 8B Instant (free tier)
@@ -100,56 +209,53 @@ class FreeDetector:
 
     def __init__(self, language: str = "English"):
         self.language = language
-
-    def _groq_detect(self, inp: DetectionInput) -> HallucinationResult:
-        api_key = os.environ.get("GROQ_API_KEY", "").strip()
-        if not api_key:
-            raise ValueError("GROQ_API_KEY not set")
-
-        payload = json.dumps({
+        # Everything but the user message is fixed per instance
+        self._system_msg = {"role": "system", "content": _get_system_prompt(language)}
+        self._payload_template = {
             "model": self.GROQ_MODEL,
-            "messages": [
-                {"role": "system", "content": _get_system_prompt(self.language)},
-                {"role": "user",   "content": _build_user_message(inp)},
-            ],
             "temperature": 0.1,
             "max_tokens":  600,
             "response_format": {"type": "json_object"},
-        }).encode()
-
-        req = urllib.request.Request(
-            self.GROQ_URL, data=payload,
-            headers={
-                "Content-Type":  "application/json",
-                "Authorization": f"Bearer {api_key}",
-                "User-Agent":    "TruthyDetector/7.0",
-            },
-        )
-        with urllib.request.urlopen(req, timeout=25) as r:
-            resp = json.loads(r.read())
-        return _parse_raw(_clean_json(resp["choices"][0]["message"]["content"]))
-
-    def _heuristic_fallback(self, inp: DetectionInput) -> HallucinationResult:
-        import string
-
-        def tokens(t):
-            t = t.lower().translate(str.maketrans('', '', string.punctuation))
-            return set(t.split())
-
-        STOPWORDS = {
-            "the","a","an","is","was","are","were","be","been","being","have","has",
-            "had","do","does","did","will","would","shall","should","may","might",
-            "must","can","could","to","of","in","for","on","with","at","by","from",
-            "up","about","into","through","during","it","its","this","that","these",
-            "those","and","but","or","nor","not","so","yet","both","either","neither",
-            "because","as","if","then","than","when","where","who","which","what",
-            "he","she","they","we","you","i","me","him","her","us","them","also",
         }
+        self._headers = {
+            "Content-Type":  "application/json",
+            "Authorization": f"Bearer {_GROQ_KEY}",
+            "User-Agent":    "TruthyDetector/7.0",
+        }
+
+    def _groq_request(self, inp: DetectionInput) -> tuple[bytes, dict]:
+        if not _GROQ_KEY:
+            raise ValueError("GROQ_API_KEY not set")
 
-        para_tok = tokens(inp.paragraph) - STOPWORDS
-        ans_tok  = tokens(inp.answer)    - STOPWORDS
-        q_tok    = tokens(inp.question)  - STOPWORDS
+        payload = orjson.dumps({
+            **self._payload_template,
+            "messages": [
+                self._system_msg,
+                {"role": "user", "content": _build_user_message(inp)},
+            ],
+        })
+        return payload, self._headers
+
+    def _groq_detect(self, inp: DetectionInput) -> HallucinationResult:
+        payload, headers = self._groq_request(inp)
+        r = _GROQ_HTTP.post(self.GROQ_URL, content=payload, headers=headers)
+        r.raise_for_status()
+        resp = orjson.loads(r.content)
+        return parse_response(resp["choices"][0]["message"]["content"])
+
+    async def _agroq_detect(self, inp: DetectionInput) -> HallucinationResult:
+        payload, headers = self._groq_request(inp)
+        client = _GROQ_AHTTP.get()
+        if client is not None:
+            r = await client.post(self.GROQ_URL, content=payload, headers=headers)
+        else:
+            async with _groq_async_client() as client:
+                r = await client.post(self.GROQ_URL, content=payload, headers=headers)
+        r.raise_for_status()
+        resp = orjson.loads(r.content)
+        return parse_response(resp["choices"][0]["message"]["content"])
 
+    def _heuristic_fallback(self, inp: DetectionInput) -> HallucinationResult:
         is_hallucinated = False
         confidence      = 50
         h_type          = None
@@ -158,11 +264,10 @@ class FreeDetector:
         correct_answer  = ""
 
         if inp.paragraph.strip():
+            para_tok, caps_para, para_hits = _prep_para(inp.paragraph)
+            ans_tok    = _tokens(inp.answer)
             overlap    = len(ans_tok & para_tok) / max(len(ans_tok), 1)
-            caps_ans   = {w for w in inp.answer.split()    if w[0].isupper() and len(w) > 2}
-            caps_para  = {w for w in inp.paragraph.split() if w[0].isupper() and len(w) > 2}
-            caps_q     = {w for w in inp.question.split()  if w[0].isupper() and len(w) > 2}
-            novel_caps = caps_ans - caps_para - caps_q
+            novel_caps = _caps(inp.answer) - caps_para - _caps(inp.question)
 
             if novel_caps and overlap < 0.35:
                 is_hallucinated       = True
@@ -176,24 +281,13 @@ class FreeDetector:
                 )
                 correct_answer = "Answer should be grounded in the provided paragraph."
             else:
-                inversion_pairs = [
-                    ({"promotes","supports","endorses","advocates","favors"},
-                     {"critiques","opposes","criticizes","condemns","depicts","warns"}),
-                    ({"won","victory","champion","defeated","beat"},
-                     {"lost","surrendered","conceded"}),
-                    ({"invented","created","founded","built"},
-                     {"discovered","found","explored"}),
-                ]
-                para_l, ans_l = inp.paragraph.lower(), inp.answer.lower()
-                for pos_w, neg_w in inversion_pairs:
-                    if (any(w in ans_l for w in pos_w) and any(w in para_l for w in neg_w)) or \
-                       (any(w in ans_l for w in neg_w) and any(w in para_l for w in pos_w)):
-                        is_hallucinated = True
-                        h_type          = "3"
-                        confidence      = 70
-                        explanation     = "Answer intent contradicts paragraph framing — predicate inversion detected."
-                        correct_answer  = "Answer relationship should align with paragraph intent."
-                        break
+                # Same pair, opposite polarity in answer vs paragraph
+                if any((cid, -pol) in para_hits for cid, pol in _inversion_hits(inp.answer)):
+                    is_hallucinated = True
+                    h_type          = "3"
+                    confidence      = 70
+                    explanation     = "Answer intent contradicts paragraph framing — predicate inversion detected."
+                    correct_answer  = "Answer relationship should align with paragraph intent."
 
                 if not is_hallucinated:
                     confidence  = 80
@@ -209,11 +303,10 @@ class FreeDetector:
                 explanation=explanation, correct_answer="",
             )
 
-        type_map = {t.value: t for t in HallucinationType}
         return HallucinationResult(
             is_hallucinated       = True,
             confidence            = confidence,
-            hallucination_types   = [type_map[h_type]] if h_type in type_map else [],
+            hallucination_types   = [_TYPE_MAP[h_type]] if h_type in _TYPE_MAP else [],
             hallucinated_elements = hallucinated_elements,
             explanation           = explanation,
             correct_answer        = correct_answer,
@@ -225,6 +318,12 @@ class FreeDetector:
         except Exception:
             return self._heuristic_fallback(inp)
 
+    async def adetect(self, inp: DetectionInput) -> HallucinationResult:
+        try:
+            return await self._agroq_detect(inp)
+        except Exception:
+            return self._heuristic_fallback(inp)
+
 
 # ── OpenAI — GPT-4o ──────────────────────────────────────────────────────────
 class OpenAIDetector:
@@ -232,9 +331,19 @@ class OpenAIDetector:
         from openai import OpenAI
         self.client   = OpenAI(api_key=api_key)
         self.language = language
-
-    def detect(self, inp: DetectionInput) -> HallucinationResult:
-        r = self.client.chat.completions.create(
+        self._api_key = api_key
+        self._aclient = None    # built on first adetect; the API never needs it
+
+    @property
+    def aclient(self):
+        if self._aclient is None:
+            from openai import AsyncOpenAI
+            self._aclient = AsyncOpenAI(api_key=self._api_key)
+        return self._aclient
+
+    def request_body(self, inp: DetectionInput) -> dict:
+        """Chat-completions body for inp (also used for Batch API lines)."""
+        return dict(
             model="gpt-4o", max_tokens=1024,
             response_format={"type": "json_object"},
             messages=[
@@ -242,7 +351,14 @@ class OpenAIDetector:
                 {"role": "user",   "content": _build_user_message(inp)},
             ]
         )
-        return _parse_raw(_clean_json(r.choices[0].message.content))
+
+    def detect(self, inp: DetectionInput) -> HallucinationResult:
+        r = self.client.chat.completions.create(**self.request_body(inp))
+        return parse_response(r.choices[0].message.content)
+
+    async def adetect(self, inp: DetectionInput) -> HallucinationResult:
+        r = await self.aclient.chat.completions.create(**self.request_body(inp))
+        return parse_response(r.choices[0].message.content)
 
 
 # ── Gemini — Gemini 1.5 Pro ───────────────────────────────────────────────────
@@ -251,22 +367,30 @@ class GeminiDetector:
         import google.generativeai as genai
         genai.configure(api_key=api_key)
         self.language = language
-
-    def detect(self, inp: DetectionInput) -> HallucinationResult:
-        import google.generativeai as genai
-        model = genai.GenerativeModel(
+        # Built once and reused for every call on this detector
+        self._model = genai.GenerativeModel(
             model_name="gemini-1.5-pro",
-            system_instruction=_get_system_prompt(self.language),
+            system_instruction=_get_system_prompt(language),
             generation_config={
                 "response_mime_type": "application/json",
                 "max_output_tokens": 1024,
                 "temperature": 0.1,
             },
         )
-        return _parse_raw(_clean_json(model.generate_content(_build_user_message(inp)).text))
+
+    def detect(self, inp: DetectionInput) -> HallucinationResult:
+        return parse_response(self._model.generate_content(_build_user_message(inp)).text)
+
+    async def adetect(self, inp: DetectionInput) -> HallucinationResult:
+        r = await self._model.generate_content_async(_build_user_message(inp))
+        return parse_response(r.text)
 
 
 # ── Unified entry point ───────────────────────────────────────────────────────
+_RESULT_CACHE_SIZE = 1024
+_RESULT_CACHE_TTL  = 3600    # seconds
+
+
 class HallucinationDetector:
     def __init__(self, provider: str = "free", api_key: str = "", language: str = "English"):
         provider = provider.lower()
@@ -278,6 +402,93 @@ class HallucinationDetector:
             self._backend = GeminiDetector(api_key, language=language)
         else:
             raise ValueError(f"Unknown provider '{provider}'.")
+        # TTL LRU of model verdicts — re-running the same triple skips the LLM
+        # call. Keyed on a digest so client text is not retained.
+        self._cache: OrderedDict[bytes, tuple[float, HallucinationResult]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _cache_key(self, inp: DetectionInput) -> bytes:
+        h = hashlib.blake2b(digest_size=16)
+        for s in (inp.paragraph, inp.question, inp.answer, self._backend.language):
+            b = s.encode()
+            h.update(len(b).to_bytes(8, "little"))   # length prefix keeps fields apart
+            h.update(b)
+        return h.digest()
+
+    def _cached(self, key: bytes) -> Optional[HallucinationResult]:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry[1]
+
+    def _remember(self, key: bytes, result: HallucinationResult) -> HallucinationResult:
+        # Heuristic fallbacks carry no raw_response; leave them out so the
+        # next call gets another shot at the model.
+        if result.raw_response is None:
+            return result
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + _RESULT_CACHE_TTL, result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > _RESULT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
 
     def detect(self, inp: DetectionInput) -> HallucinationResult:
-        return self._backend.detect(inp)
+        key = self._cache_key(inp)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        return self._remember(key, self._backend.detect(inp))
+
+    async def adetect(self, inp: DetectionInput) -> HallucinationResult:
+        key = self._cache_key(inp)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        return self._remember(key, await self._backend.adetect(inp))
+
+    async def adetect_batch(self, inps: list[DetectionInput],
+                            concurrency: int = 10) -> list[HallucinationResult]:
+        """Detect many inputs concurrently; results come back in input order."""
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(inp: DetectionInput) -> HallucinationResult:
+            async with sem:
+                return await self.adetect(inp)
+
+        if not isinstance(self._backend, FreeDetector):
+            return await asyncio.gather(*(_one(inp) for inp in inps))
+        # One Groq connection pool for the whole batch
+        async with _groq_async_client() as client:
+            token = _GROQ_AHTTP.set(client)
+            try:
+                return await asyncio.gather(*(_one(inp) for inp in inps))
+            finally:
+                _GROQ_AHTTP.reset(token)
+
+
+def detect_ensemble(inp: DetectionInput, detectors: list[HallucinationDetector]
+                    ) -> list[tuple[Optional[HallucinationResult], Optional[Exception]]]:
+    """Run one input through several detectors at once (e.g. free + openai + gemini).
+
+    Calls overlap in threads, so the wall time is that of the slowest provider
+    rather than the sum. Returns one (result, error) pair per detector, in the
+    order of `detectors`; a provider that raises doesn't discard the others.
+
+    genai.configure is process-global, so two Gemini detectors with different
+    keys can't run in the same ensemble — both would use the last key set.
+    """
+    if not detectors:
+        return []
+    with ThreadPoolExecutor(max_workers=len(detectors)) as ex:
+        futures = [ex.submit(d.detect, inp) for d in detectors]
+    out = []
+    for f in futures:
+        err = f.exception()
+        out.append((None, err) if err is not None else (f.result(), None))
+    return out
@@ -3,6 +3,9 @@ Terminal display utilities for the Hallucination Detection Framework.
 Uses ANSI color codes for a rich CLI experience.
 """
 
+import sys
+import textwrap
+
 from src.models import DetectionInput, HallucinationResult, HallucinationType
 
 # ── ANSI color codes ──────────────────────────────────────────────────────────
@@ -26,110 +29,114 @@ class C:
 
 # Type-specific colors
 TYPE_COLORS = {
-    "1A": C.RED,
-    "1B": C.YELLOW,
-    "2A": C.MAGENTA,
-    "3A": C.BLUE,
+    "1": C.RED,
+    "2": C.YELLOW,
+    "3": C.MAGENTA,
+    "4": C.BLUE,
 }
 
+_RULE = f"{C.GRAY}  {'─' * 63}{C.RESET}"
+
+
+def _write(lines: list[str]):
+    """One write + flush per block instead of a syscall per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 
 class ResultDisplay:
+    """Builds each block as a list of lines and writes it with one stdout call."""
 
     def print_banner(self):
-        print(f"\n{C.CYAN}{C.BOLD}")
-        print("  ╔══════════════════════════════════════════════════════════════╗")
-        print("  ║         HALLUCINATION DETECTION FRAMEWORK  v1.0             ║")
-        print("  ║                   Powered by OpenAI GPT-4o                  ║")
-        print("  ╚══════════════════════════════════════════════════════════════╝")
-        print(f"{C.RESET}")
-
-        # Legend
-        print(f"  {C.BOLD}Taxonomy:{C.RESET}")
+        lines = [
+            "",
+            f"{C.CYAN}{C.BOLD}",
+            "  ╔══════════════════════════════════════════════════════════════╗",
+            "  ║         HALLUCINATION DETECTION FRAMEWORK  v1.0             ║",
+            "  ║                   Powered by OpenAI GPT-4o                  ║",
+            "  ╚══════════════════════════════════════════════════════════════╝",
+            f"{C.RESET}",
+            # Legend
+            f"  {C.BOLD}Taxonomy:{C.RESET}",
+        ]
         for ht in HallucinationType:
             color = TYPE_COLORS.get(ht.value, C.WHITE)
-            print(f"  {color}[{ht.value}]{C.RESET} {ht.icon}  "
-                  f"{C.BOLD}{ht.display_name}{C.RESET}"
-                  f"{C.GRAY} – {ht.description}{C.RESET}")
-        print()
+            lines.append(f"  {color}[{ht.value}]{C.RESET} {ht.icon}  "
+                         f"{C.BOLD}{ht.display_name}{C.RESET}"
+                         f"{C.GRAY} – {ht.description}{C.RESET}")
+        lines.append("")
+        _write(lines)
 
     def show_result(self, inp: DetectionInput, result: HallucinationResult):
         """Print a full detection result to the terminal."""
-        self._print_input_summary(inp)
-        self._print_verdict(result)
+        lines: list[str] = []
+        self._input_summary(lines, inp)
+        self._verdict(lines, result)
         if result.is_hallucinated:
-            self._print_types(result)
-            self._print_hallucinated_elements(result)
-        self._print_explanation(result)
-        self._print_correct_answer(result)
-        self._print_confidence_bar(result)
+            self._types(lines, result)
+            self._hallucinated_elements(lines, result)
+        self._explanation(lines, result)
+        self._correct_answer(lines, result)
+        self._confidence_bar(lines, result)
+        _write(lines)
 
     # ── Private ───────────────────────────────────────────────────────────────
 
-    def _print_input_summary(self, inp: DetectionInput):
-        print(f"\n{C.GRAY}  {'─' * 63}{C.RESET}")
-        print(f"  {C.BOLD}{C.WHITE}INPUT SUMMARY{C.RESET}")
-        print(f"{C.GRAY}  {'─' * 63}{C.RESET}")
+    def _input_summary(self, lines: list, inp: DetectionInput):
+        lines += ["", _RULE, f"  {C.BOLD}{C.WHITE}INPUT SUMMARY{C.RESET}", _RULE]
         if inp.paragraph:
             excerpt = inp.paragraph.strip()
             excerpt = excerpt[:200] + ("…" if len(excerpt) > 200 else "")
-            print(f"  {C.GRAY}Paragraph :{C.RESET} {excerpt}")
+            lines.append(f"  {C.GRAY}Paragraph :{C.RESET} {excerpt}")
         else:
-            print(f"  {C.GRAY}Paragraph :{C.RESET} {C.DIM}(none – world knowledge used){C.RESET}")
-        print(f"  {C.GRAY}Question  :{C.RESET} {C.CYAN}{inp.question}{C.RESET}")
-        print(f"  {C.GRAY}Answer    :{C.RESET} {C.YELLOW}{inp.answer}{C.RESET}")
+            lines.append(f"  {C.GRAY}Paragraph :{C.RESET} {C.DIM}(none – world knowledge used){C.RESET}")
+        lines.append(f"  {C.GRAY}Question  :{C.RESET} {C.CYAN}{inp.question}{C.RESET}")
+        lines.append(f"  {C.GRAY}Answer    :{C.RESET} {C.YELLOW}{inp.answer}{C.RESET}")
 
-    def _print_verdict(self, result: HallucinationResult):
-        print(f"\n{C.GRAY}  {'─' * 63}{C.RESET}")
+    def _verdict(self, lines: list, result: HallucinationResult):
+        lines += ["", _RULE]
         if result.is_hallucinated:
-            print(f"  {C.BG_RED}{C.BOLD}{C.WHITE}  🚨  VERDICT: HALLUCINATION DETECTED  {C.RESET}")
+            lines.append(f"  {C.BG_RED}{C.BOLD}{C.WHITE}  🚨  VERDICT: HALLUCINATION DETECTED  {C.RESET}")
         else:
-            print(f"  {C.BG_GREEN}{C.BOLD}{C.WHITE}  ✅  VERDICT: OUTPUT IS CLEAN (NO HALLUCINATION)  {C.RESET}")
-        print(f"{C.GRAY}  {'─' * 63}{C.RESET}")
+            lines.append(f"  {C.BG_GREEN}{C.BOLD}{C.WHITE}  ✅  VERDICT: OUTPUT IS CLEAN (NO HALLUCINATION)  {C.RESET}")
+        lines.append(_RULE)
 
-    def _print_types(self, result: HallucinationResult):
+    def _types(self, lines: list, result: HallucinationResult):
         if not result.hallucination_types:
             return
-        print(f"\n  {C.BOLD}Hallucination Type(s) Detected:{C.RESET}")
+        lines += ["", f"  {C.BOLD}Hallucination Type(s) Detected:{C.RESET}"]
         for ht in result.hallucination_types:
             color = TYPE_COLORS.get(ht.value, C.WHITE)
-            print(f"    {color}{C.BOLD}[{ht.value}]{C.RESET}  "
-                  f"{ht.icon}  {C.BOLD}{ht.display_name}{C.RESET}")
-            print(f"         {C.GRAY}{ht.description}{C.RESET}")
+            lines.append(f"    {color}{C.BOLD}[{ht.value}]{C.RESET}  "
+                         f"{ht.icon}  {C.BOLD}{ht.display_name}{C.RESET}")
+            lines.append(f"         {C.GRAY}{ht.description}{C.RESET}")
 
-    def _print_hallucinated_elements(self, result: HallucinationResult):
+    def _hallucinated_elements(self, lines: list, result: HallucinationResult):
         if not result.hallucinated_elements:
             return
-        print(f"\n  {C.BOLD}Hallucinated Element(s):{C.RESET}")
+        lines += ["", f"  {C.BOLD}Hallucinated Element(s):{C.RESET}"]
         for elem in result.hallucinated_elements:
-            print(f"    {C.RED}✗{C.RESET}  {elem}")
+            lines.append(f"    {C.RED}✗{C.RESET}  {elem}")
 
-    def _print_explanation(self, result: HallucinationResult):
+    def _explanation(self, lines: list, result: HallucinationResult):
         if not result.explanation:
             return
-        print(f"\n  {C.BOLD}Explanation:{C.RESET}")
-        # Word-wrap at ~60 chars
-        words = result.explanation.split()
-        line = "    "
-        for word in words:
-            if len(line) + len(word) + 1 > 66:
-                print(line)
-                line = "    " + word + " "
-            else:
-                line += word + " "
-        if line.strip():
-            print(line)
-
-    def _print_correct_answer(self, result: HallucinationResult):
+        lines += ["", f"  {C.BOLD}Explanation:{C.RESET}",
+                  textwrap.fill(result.explanation, width=65,
+                                initial_indent="    ", subsequent_indent="    ",
+                                break_long_words=False, break_on_hyphens=False)]
+
+    def _correct_answer(self, lines: list, result: HallucinationResult):
         if not result.correct_answer:
             return
-        print(f"\n  {C.BOLD}Correct Answer:{C.RESET}")
-        print(f"    {C.GREEN}{result.correct_answer}{C.RESET}")
+        lines += ["", f"  {C.BOLD}Correct Answer:{C.RESET}",
+                  f"    {C.GREEN}{result.correct_answer}{C.RESET}"]
 
-    def _print_confidence_bar(self, result: HallucinationResult):
+    def _confidence_bar(self, lines: list, result: HallucinationResult):
         pct = result.confidence
         filled = round(pct / 5)           # out of 20 blocks
         bar = "█" * filled + "░" * (20 - filled)
         color = C.GREEN if pct >= 75 else C.YELLOW if pct >= 50 else C.RED
-        print(f"\n  {C.BOLD}Confidence:{C.RESET}  "
-              f"{color}[{bar}]{C.RESET}  {C.BOLD}{pct}%{C.RESET}")
-        print(f"{C.GRAY}  {'─' * 63}{C.RESET}\n")
+        lines += ["", f"  {C.BOLD}Confidence:{C.RESET}  "
+                      f"{color}[{bar}]{C.RESET}  {C.BOLD}{pct}%{C.RESET}",
+                  _RULE, ""]
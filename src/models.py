@@ -3,11 +3,32 @@ Data models for the Hallucination Detection Framework.
 Taxonomy updated to simple 1/2/3/4 numbering.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from enum import Enum
 
 
+# code → (display name, description, icon); built once at import, strings interned
+_TYPE_META = {code: tuple(sys.intern(s) for s in meta) for code, meta in {
+    "1": ("Out-of-Context Entity Hallucination",
+          "Answer introduces an entity not present in / inferable from the paragraph",
+          "⚡"),
+    "2": ("Tuple Verification Hallucination",
+          "Real entities exist but are incorrectly paired or linked together",
+          "🔗"),
+    "3": ("Out-of-Context Intent Hallucination",
+          "Entities are correct but the verb / action / relationship is wrong or inverted",
+          "🎯"),
+    "4": ("Triple Verification Hallucination",
+          "The full subject–predicate–object triple is wrong at every structural level",
+          "🔺"),
+}.items()}
+
+# Codes from the earlier 1A/1B/2A/3A taxonomy → current codes
+LEGACY_CODES = {"1A": "1", "1B": "2", "2A": "3", "3A": "4"}
+
+
 class HallucinationType(str, Enum):
     """
     Hallucination taxonomy — simple 1/2/3/4 numbering.
@@ -22,30 +43,25 @@ class HallucinationType(str, Enum):
     INTENT_OUT_OF_CONTEXT = "3"
     SEMANTIC_TRIPLE       = "4"
 
+    @classmethod
+    def from_code(cls, code: str) -> "HallucinationType":
+        """Look up a type by current ("1"–"4") or legacy ("1A"/"1B"/"2A"/"3A") code."""
+        return cls(LEGACY_CODES.get(code, code))
+
     @property
     def display_name(self) -> str:
-        return {
-            "1": "Out-of-Context Entity Hallucination",
-            "2": "Tuple Verification Hallucination",
-            "3": "Out-of-Context Intent Hallucination",
-            "4": "Triple Verification Hallucination",
-        }[self.value]
+        return _TYPE_META[self.value][0]
 
     @property
     def description(self) -> str:
-        return {
-            "1": "Answer introduces an entity not present in / inferable from the paragraph",
-            "2": "Real entities exist but are incorrectly paired or linked together",
-            "3": "Entities are correct but the verb / action / relationship is wrong or inverted",
-            "4": "The full subject–predicate–object triple is wrong at every structural level",
-        }[self.value]
+        return _TYPE_META[self.value][1]
 
     @property
     def icon(self) -> str:
-        return {"1": "⚡", "2": "🔗", "3": "🎯", "4": "🔺"}[self.value]
+        return _TYPE_META[self.value][2]
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectionInput:
     """Input to the hallucination detector."""
     question:  str
@@ -53,27 +69,39 @@ class DetectionInput:
     paragraph: str = ""
 
     def summary(self) -> str:
-        lines = []
-        if self.paragraph:
-            short = self.paragraph[:120] + ("…" if len(self.paragraph) > 120 else "")
-            lines.append(f"  Paragraph : {short}")
+        if not self.paragraph:
+            preview = "(none – world knowledge used)"
+        elif len(self.paragraph) > 120:
+            preview = self.paragraph[:120] + "…"
         else:
-            lines.append("  Paragraph : (none – world knowledge used)")
-        lines.append(f"  Question  : {self.question}")
-        lines.append(f"  Answer    : {self.answer}")
-        return "\n".join(lines)
+            preview = self.paragraph
+        return "\n".join((
+            f"  Paragraph : {preview}",
+            f"  Question  : {self.question}",
+            f"  Answer    : {self.answer}",
+        ))
 
 
-@dataclass
+@dataclass(frozen=True)
 class HallucinationResult:
-    """Full result returned by the detector."""
+    """Full result returned by the detector (immutable — results are cached and shared)."""
     is_hallucinated:       bool
     confidence:            int
-    hallucination_types:   List[HallucinationType] = field(default_factory=list)
-    hallucinated_elements: List[str]               = field(default_factory=list)
+    hallucination_types:   Tuple[HallucinationType, ...] = ()
+    hallucinated_elements: Tuple[str, ...]               = ()
     explanation:           str  = ""
     correct_answer:        str  = ""
     raw_response:          Optional[dict] = field(default=None, repr=False)
+    # Derived once in __post_init__
+    _type_codes:           Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Lists are accepted but stored as tuples, so a cached result can't be
+        # changed in place by whoever it is handed to
+        object.__setattr__(self, "hallucination_types", tuple(self.hallucination_types))
+        object.__setattr__(self, "hallucinated_elements", tuple(self.hallucinated_elements))
+        object.__setattr__(self, "_type_codes",
+                           tuple(t.value for t in self.hallucination_types))
 
     @property
     def verdict(self) -> str:
@@ -81,4 +109,4 @@ class HallucinationResult:
 
     @property
     def type_codes(self) -> List[str]:
-        return [t.value for t in self.hallucination_types]
+        return list(self._type_codes)